@@ -7,12 +7,34 @@ temperature, and precipitation data based on configuration settings.
 import sys
 import traceback
 
+from components.batch_render import render_cities
 from components.config import ConfigurationError, load_config
-from components.data_handler import DataHandler
-from components.base_calendar_plotter import BaseCalendarPlotter
-from components.layer_temperature import TemperatureLayer
-from components.layer_precipitation import PrecipitationLayer
-from components.layer_day import DayLayer
+
+
+def build_layers(config):
+    """Apply the day calendar settings to config and return its layers."""
+    # Plotting modules pull in matplotlib, so import them only once there is
+    # a valid configuration to render
+    from components.layer_temperature import TemperatureLayer
+    from components.layer_precipitation import PrecipitationLayer
+    from components.layer_day import DayLayer
+
+    config.file_name = f"{config.city_name}_Day"
+
+    # Ring position configuration
+    # Example settings shown in comments
+    config.temp_offset = 0.062  # Higher means more inside the circle
+    config.temp_footer_offset = 0.01
+    config.precip_offset = 0.042
+    config.precip_footer_offset = 0.04
+    # config.use_sunday_layer = False  # Uncomment to disable Sunday layer
+
+    # Create and combine visualization layers
+    return [
+        DayLayer(config),
+        TemperatureLayer(config),
+        PrecipitationLayer(config)
+    ]
 
 
 def main():
@@ -21,33 +43,14 @@ def main():
     1. Loads config and data
     2. Sets up visualization layers
     3. Generates final plot
+    Several city names may be given to render them in parallel.
     """
     try:
-        city_name = sys.argv[1] if len(sys.argv) > 1 else None
         config = load_config()
-        if city_name:
-            config.city_name = city_name
-
-        # Load data and set configuration
-        data_handler = DataHandler(config)
-        config.dawn_data, config.weather_data, config.city_data, config.sun_data = data_handler.load_data()
-        config.file_name = f"{city_name}_Day"
-
-        # Ring position configuration
-        # Example settings shown in comments
-        config.temp_offset = 0.062  # Higher means more inside the circle
-        config.temp_footer_offset = 0.01
-        config.precip_offset = 0.042
-        config.precip_footer_offset = 0.04
-        # config.use_sunday_layer = False  # Uncomment to disable Sunday layer
-
-        # Create and combine visualization layers
-        plotter = BaseCalendarPlotter(config)
-        plotter.create_plot(layers=[
-            DayLayer(config),
-            TemperatureLayer(config),
-            PrecipitationLayer(config)
-        ])
+        city_names = sys.argv[1:] or [config.city_name]
+
+        from components.base_calendar_plotter import BaseCalendarPlotter
+        render_cities(city_names, config, BaseCalendarPlotter, build_layers)
 
     except ConfigurationError as e:
         print(f"Configuration error: {str(e)}")
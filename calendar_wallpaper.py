@@ -4,13 +4,8 @@ import sys
 import traceback
 from dataclasses import dataclass
 from typing import Dict
+from components.batch_render import render_cities
 from components.config import ConfigurationError, load_config
-from components.data_handler import DataHandler
-from components.wallpaper_calendar_plotter import WallpaperCalendarPlotter
-from components.layer_dawn import DawnLayer
-from components.layer_temperature import TemperatureLayer
-from components.layer_strava import StravaLayer
-from components.layer_holidays import HolidaysLayer
 
 @dataclass
 class WallpaperConfig:
@@ -29,46 +24,54 @@ class WallpaperConfig:
             }
 
 
+def build_layers(config):
+    """Apply the wallpaper settings to config and return its layers."""
+    # Plotting modules pull in matplotlib, so import them only once there is
+    # a valid configuration to render
+    from components.layer_dawn import DawnLayer
+    from components.layer_temperature import TemperatureLayer
+    from components.layer_strava import StravaLayer
+    from components.layer_holidays import HolidaysLayer
+
+    config.file_name = f"{config.city_name}_Wallpaper"
+    config.running_target = 1000 # Yearly target for running in km
+
+    # Set wallpaper specific config
+    wallpaper_config = WallpaperConfig()
+    wallpaper_config.width = 1920  # For Full HD
+    wallpaper_config.height = 1080
+    # Or for 4K:
+    # wallpaper_config.width = 3840
+    # wallpaper_config.height = 2160
+    
+    # Set the calendar position that worked well
+    wallpaper_config.calendar_position = {
+        "left": -0.3,
+        "bottom": -1.2,
+        "width": 1.02,
+        "height": 2.3
+    }
+    
+    config.wallpaper = wallpaper_config
+    config.use_sunday_layer = False
+
+    # Create and combine layers
+    return [
+        DawnLayer(config),
+        TemperatureLayer(config),
+        StravaLayer(config),
+        HolidaysLayer(config)
+    ]
+
+
 def main():
     try:
         # Setup configuration
         config = load_config()
-        config.city_name = sys.argv[1] if len(sys.argv) > 1 else config.city_name
-        config.file_name = f"{config.city_name}_Wallpaper"
-        config.running_target = 1000 # Yearly target for running in km
-
-        # Load data and initialize layers
-        data_handler = DataHandler(config)
-        (config.dawn_data, config.weather_data,
-         config.city_data, config.sun_data) = data_handler.load_data()
-        
-        # Set wallpaper specific config
-        wallpaper_config = WallpaperConfig()
-        wallpaper_config.width = 1920  # For Full HD
-        wallpaper_config.height = 1080
-        # Or for 4K:
-        # wallpaper_config.width = 3840
-        # wallpaper_config.height = 2160
-        
-        # Set the calendar position that worked well
-        wallpaper_config.calendar_position = {
-            "left": -0.3,
-            "bottom": -1.2,
-            "width": 1.02,
-            "height": 2.3
-        }
-        
-        config.wallpaper = wallpaper_config
-        config.use_sunday_layer = False
+        city_names = sys.argv[1:] or [config.city_name]
 
-        # Create and combine layers
-        plotter = WallpaperCalendarPlotter(config)
-        plotter.create_plot(layers=[
-            DawnLayer(config),
-            TemperatureLayer(config),
-            StravaLayer(config),
-            HolidaysLayer(config)
-        ])
+        from components.wallpaper_calendar_plotter import WallpaperCalendarPlotter
+        render_cities(city_names, config, WallpaperCalendarPlotter, build_layers)
 
     except ConfigurationError as e:
         print(f"Configuration error: {str(e)}")
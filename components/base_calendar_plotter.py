@@ -1,15 +1,47 @@
-import matplotlib.pyplot as plt
-from matplotlib.font_manager import FontProperties
+from __future__ import annotations
+
 import numpy as np
-from typing import List, Tuple
+from functools import cached_property, lru_cache
+from typing import TYPE_CHECKING, List, Tuple
 
 from datetime import date, timedelta
 
 from components.data_types import Config
-from components.data_handler import DataHandler
+
+# matplotlib is imported where it is used, so helpers such as
+# format_coordinates and find_first_sunday don't pay for loading it
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
+
+
+@lru_cache(maxsize=None)
+def load_font(fname, size):
+    """Load a font file once per (file, size) and reuse it across plots."""
+    from matplotlib.font_manager import FontProperties
+    return FontProperties(fname=fname, size=size)
+
+
+@lru_cache(maxsize=None)
+def _fallback_font(weight, size):
+    """System font fallback, cached the same way as load_font."""
+    from matplotlib.font_manager import FontProperties
+    return FontProperties(weight=weight, size=size)
+
+
+@lru_cache(maxsize=4)
+def _theta(num_points):
+    """Circular positions for num_points days, shared by every plotter and layer."""
+    theta = np.linspace(0, 2 * np.pi, num_points)
+    theta.flags.writeable = False  # Shared, so callers must not modify it
+    return theta
 
 
 class BaseCalendarPlotter:
+    # Figure shared by successive plots in the same process, see setup_plot
+    _figure = None
+    # Title font sizes in points
+    title_font_sizes = {'bold': 64, 'regular': 20, 'year': 48}
+
     def __init__(self, config: Config, layers=None):
         self.config = config
         self.config.file_name = getattr(
@@ -21,35 +53,77 @@ class BaseCalendarPlotter:
         self.coordinates = self.city_data.coordinates
         self.year = self.city_data.year
         self.days_in_month = self.city_data.days_in_month
+        self.cumulative_days = np.cumsum(self.days_in_month)
+        self.first_sunday = self.find_first_sunday(self.year)
+        self.theta = _theta(self.num_points)  # Circular positions
+        # Month ends as angles; the last divider closes the circle at exactly 2π
+        self.month_boundaries_rad = np.append(
+            self.cumulative_days[:-1] / self.num_points * 2 * np.pi, 2 * np.pi)
         self.theta_offset = 1.5707963267948966
 
-    @property
+    @cached_property
+    def title_fonts(self):
+        """Resolve the title fonts once per plotter, falling back to system fonts."""
+        sizes = self.title_font_sizes
+        try:
+            return {k: load_font(f'./fonts/Arvo-{v}.ttf', sizes[k])
+                    for k, v in [('bold', 'Bold'),
+                                 ('regular', 'Regular'),
+                                 ('year', 'Regular')]}
+        except:
+            return {k: _fallback_font(w, sizes[k])
+                    for k, w in [('bold', 'bold'),
+                                 ('regular', None),
+                                 ('year', None)]}
+
+    @cached_property
     def start_time(self):
         """Calculate the earliest start time across all layers."""
         times = [
             layer.start_time for layer in self.layers if layer.start_time is not None]
         return min(times) if times else 0
 
-    @property
+    @cached_property
     def end_time(self):
         """Calculate the latest end time across all layers."""
         times = [
             layer.end_time for layer in self.layers if layer.end_time is not None]
         return max(times) if times else 24
 
+    def reset_time_range(self):
+        """Drop the cached time range so it is recomputed from the current layers."""
+        self.__dict__.pop('start_time', None)
+        self.__dict__.pop('end_time', None)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def find_first_sunday(year):
+        """Return the day-of-year index (0-based) of the first Sunday in the year."""
+        first = date(year, 1, 1)
+        return ((first + timedelta(days=(6 - first.weekday()) % 7)) - first).days
+
     @staticmethod
     def format_coordinates(coords):
         """ Converts a dictionary with latitude and longitude into a formatted string with degree sign and N/S, E/W postfixes. """
         latitude = coords.get('latitude', 0.0)
         longitude = coords.get('longitude', 0.0)
 
-        return f"{abs(latitude):.6f}°{'N' if latitude >= 0 else 'S'},   " \
-            f"{abs(longitude):.6f}°{'E' if longitude >= 0 else 'W'}"
+        return f"{abs(latitude):.6f}°{'NS'[latitude < 0]},   " \
+            f"{abs(longitude):.6f}°{'EW'[longitude < 0]}"
 
     def setup_plot(self) -> Tuple[plt.Figure, plt.Axes]:
         """Initialize and configure the plot."""
-        fig, ax = plt.subplots(
-            figsize=(24, 24), subplot_kw=dict(polar=True, facecolor=self.config.colors['dial']), dpi=300)
+        import matplotlib.pyplot as plt
+
+        dpi = self.config.dpi
+        fig = BaseCalendarPlotter._figure
+        if fig is None or not plt.fignum_exists(fig.number):
+            fig = BaseCalendarPlotter._figure = plt.figure(figsize=(24, 24), dpi=dpi)
+        else:
+            # Reuse the figure, and with it the large Agg buffer, from the previous plot
+            fig.clear()
+            fig.set_dpi(dpi)
+        ax = fig.add_subplot(polar=True, facecolor=self.config.colors['dial'])
         fig.patch.set_facecolor(self.config.colors['background'])
         ax.set_theta_direction(-1)
         ax.set_theta_offset(np.pi / 2)
@@ -72,21 +146,11 @@ class BaseCalendarPlotter:
 
         # Ask each layer to render its footer
         for layer in self.layers:
-            if hasattr(layer, "footer"):
-                layer.footer(fig, footer_dimensions, self)
+            layer.footer(fig, footer_dimensions, self)
 
     def add_title(self, ax: plt.Axes) -> None:
         """Add title to the plot."""
-        try:
-            font_props = {k: FontProperties(fname=f'./fonts/Arvo-{v}.ttf', size=s)
-                          for k, v, s in [('bold', 'Bold', 64),
-                                          ('regular', 'Regular', 20),
-                                          ('year', 'Regular', 48)]}
-        except:
-            font_props = {k: FontProperties(weight=w, size=s)
-                          for k, (w, s) in {'bold': ('bold', 64),
-                                            'regular': (None, 20),
-                                            'year': (None, 48)}.items()}
+        font_props = self.title_fonts
 
         common_props = {'ha': 'center',
                         'va': 'center', 'transform': ax.transAxes}
@@ -114,6 +178,7 @@ class BaseCalendarPlotter:
             from components.layer_time import TimeLayer
             self.layers.append(TimeLayer(self.config))
 
+        self.reset_time_range()
         fig, ax = self.setup_plot()
 
         for layer in layers:
@@ -126,10 +191,17 @@ class BaseCalendarPlotter:
         self.add_footer(fig)
 
         # Save plot
-        plt.subplots_adjust(top=0.95, bottom=0.3)
-
-        plt.savefig(f'./pdf/{self.config.file_name}.pdf',
-                    bbox_inches='tight', pad_inches=1)
-        plt.savefig(f'./png/{self.config.file_name}.png',
-                    bbox_inches='tight', pad_inches=1)
-        plt.close()
+        fig.subplots_adjust(top=0.95, bottom=0.3)
+
+        # PNG cost scales with dpi², so it can be rendered at a lower dpi than the PDF
+        dpi = self.config.dpi
+        png_dpi = self.config.png_dpi or dpi
+        # Work out the tight bounding box once; with bbox_inches='tight' every
+        # savefig would run its own layout pass over all the text artists
+        # Layout pass without rasterizing, needs matplotlib 3.6 (see requirements.txt)
+        fig.draw_without_rendering()
+        bbox = fig.get_tightbbox().padded(1)
+        # Saved one after the other: a Figure can't be rendered by two backends concurrently
+        fig.savefig(f'./pdf/{self.config.file_name}.pdf', dpi=dpi, bbox_inches=bbox)
+        fig.savefig(f'./png/{self.config.file_name}.png', dpi=png_dpi, bbox_inches=bbox)
+        # The figure is kept open and cleared by the next setup_plot
@@ -0,0 +1,48 @@
+"""Render a calendar for one or more cities, in parallel when there are several."""
+
+import copy
+import os
+from multiprocessing import Pool
+
+from components.data_handler import DataHandler
+
+# (config template, plotter class, layer builder) shared with worker processes
+_job = None
+
+
+def _init_worker(config_template, plotter_class, build_layers):
+    global _job
+    _job = (config_template, plotter_class, build_layers)
+
+
+def _render_in_worker(city_name):
+    render_city(city_name, *_job)
+
+
+def render_city(city_name, config_template, plotter_class, build_layers):
+    """
+    Load data for a single city and render it with plotter_class.
+    build_layers applies the calendar's own settings to the config and returns its layers.
+    """
+    config = copy.deepcopy(config_template)
+    config.city_name = city_name
+
+    # Load data and set configuration
+    data_handler = DataHandler(config)
+    (config.dawn_data, config.weather_data,
+     config.city_data, config.sun_data) = data_handler.load_data()
+
+    plotter = plotter_class(config)
+    plotter.create_plot(layers=build_layers(config))
+
+
+def render_cities(city_names, config_template, plotter_class, build_layers):
+    """Render each city, one worker process per city when several are given."""
+    if len(city_names) == 1:
+        render_city(city_names[0], config_template, plotter_class, build_layers)
+        return
+
+    processes = min(len(city_names), os.cpu_count() or 1)
+    with Pool(processes=processes, initializer=_init_worker,
+              initargs=(config_template, plotter_class, build_layers)) as pool:
+        pool.map(_render_in_worker, city_names)
@@ -1,7 +1,27 @@
 import json
-from typing import List, Tuple
+import numpy as np
+from typing import Dict, List, Tuple
 from components.data_types import DawnData, WeatherData, CityData, SunData
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def load_json(raw: bytes):
+    """
+    Parse JSON bytes, with orjson when it is installed.
+    orjson rejects the bare NaN that json.dump writes for data gaps,
+    so such files are handed to json.loads instead.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
+
 
 class DataHandler:
     """Initial data handling class with minimal changes from original implementation."""
@@ -17,14 +37,20 @@ class DataHandler:
         Keeps close to original implementation while providing better structure.
         """
         try:
-            with open(self.data_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(self.data_file, 'rb') as f:
+                data = load_json(f.read())
+
+            # Sun series are stored as float arrays so layers don't convert them on every plot
+            sunrise = _series(data['sunrise'])
+            civil_dawn, civil_dusk = _pairs(data['civil'])
+            nautical_dawn, nautical_dusk = _pairs(data['nautical'])
+            astro_dawn, astro_dusk = _pairs(data['astro'])
 
             dawn_data = DawnData(
-                sunrise=data['sunrise'],
-                civil_dawn=[d[0] for d in data['civil']],
-                nautical_dawn=[d[0] for d in data['nautical']],
-                astro_dawn=[d[0] for d in data['astro']],
+                sunrise=sunrise,
+                civil_dawn=civil_dawn,
+                nautical_dawn=nautical_dawn,
+                astro_dawn=astro_dawn,
             )
 
             weather_data = WeatherData(
@@ -40,14 +66,14 @@ class DataHandler:
             )
 
             sun_data = SunData(
-                sunrise=data['sunrise'],
-                sunset=data['sunset'],
-                civil_dawn=[d[0] for d in data['civil']],
-                nautical_dawn=[d[0] for d in data['nautical']],
-                astro_dawn=[d[0] for d in data['astro']],
-                civil_dusk=[d[1] for d in data['civil']],
-                nautical_dusk=[d[1] for d in data['nautical']],
-                astro_dusk=[d[1] for d in data['astro']]
+                sunrise=sunrise,
+                sunset=_series(data['sunset']),
+                civil_dawn=civil_dawn,
+                nautical_dawn=nautical_dawn,
+                astro_dawn=astro_dawn,
+                civil_dusk=civil_dusk,
+                nautical_dusk=nautical_dusk,
+                astro_dusk=astro_dusk
             )
 
             return dawn_data, weather_data, city_data, sun_data
@@ -58,18 +84,40 @@ class DataHandler:
         except (json.JSONDecodeError, KeyError, TypeError) as e:
             raise ValueError(f"Error processing sun data: {str(e)}")
 
-    def smooth_data(self, data: List[float], num_points: int, smoothen: bool = False) -> List[float]:
+    def smooth_data_batch(self, series: List[List[float]], num_points: int, smoothen: bool = False):
         """
-        Moved smoothing functionality to data handler as it's data processing.
-        Keeps original implementation but adds smoothen parameter.
+        Smooth several equal-length series at once, one row per series.
+        A single batched FFT covers all of them.
         """
-        import numpy as np
-
         if not smoothen:
-            return np.array(data)
+            return np.array(series)
+
+        return _low_pass(series, num_points)
+
+    def smooth_fields(self, obj, names: Tuple[str, ...], num_points: int, smoothen: bool = False) -> Dict[str, np.ndarray]:
+        """
+        Smooth the named hour series of obj in one batch.
+        Returns each series as a fraction of the day, keyed by name.
+        """
+        smoothed = self.smooth_data_batch([getattr(obj, k) for k in names], num_points, smoothen) / 24
+        return dict(zip(names, smoothed))
+
+
+def _series(values) -> np.ndarray:
+    """Convert a list of decimal hours to a float array."""
+    return np.asarray(values, dtype=np.float64)
+
+
+def _pairs(values) -> np.ndarray:
+    """Split a list of [dawn, dusk] pairs into a dawn and a dusk float array."""
+    return np.ascontiguousarray(_series(values).T)
+
 
-        """Create smooth periodic data using Fourier series."""
-        fft_coeffs = np.fft.rfft(data)
-        # Keep only lower frequencies
-        fft_coeffs[int(len(fft_coeffs) * 0.1):] = 0
-        return np.fft.irfft(fft_coeffs, num_points)
+def _low_pass(data, num_points: int, keep: float = 0.1):
+    """
+    Create smooth periodic data using Fourier series, keeping only the lowest frequencies.
+    Works along the last axis, so a 2D array smooths every row in one pass.
+    """
+    fft_coeffs = np.fft.rfft(data, axis=-1)
+    fft_coeffs[..., int(fft_coeffs.shape[-1] * keep):] = 0
+    return np.fft.irfft(fft_coeffs, num_points, axis=-1)
@@ -1,5 +1,6 @@
 from dataclasses import dataclass, field
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+import numpy as np
 
 
 @dataclass
@@ -9,39 +10,38 @@ class Config:
     year: int = 2025
     smoothen: bool = False
     interval: float = 0.25
+    dpi: int = 300
+    # PNG resolution, falls back to dpi when unset
+    png_dpi: Optional[int] = None
     # Add a kwargs field to capture additional attributes
     kwargs: Dict[str, Any] = field(default_factory=dict)
+    # Number of days in the year accounting for leap years, set in __post_init__
+    days_in_year: int = field(init=False)
 
     def __post_init__(self):
         # Set any additional attributes from kwargs
         for key, value in self.kwargs.items():
             setattr(self, key, value)
-        # Clean up kwargs
-        delattr(self, 'kwargs')
-
-    @property
-    def days_in_year(self) -> int:
-        """Calculate number of days in the year accounting for leap years."""
-        return 366 if self.year % 4 == 0 and (self.year % 100 != 0 or self.year % 400 == 0) else 365
+        self.days_in_year = 366 if self.year % 4 == 0 and (self.year % 100 != 0 or self.year % 400 == 0) else 365
 
 
 @dataclass
 class SunData:
-    sunrise: List[float]
-    sunset: List[float]
-    civil_dawn: List[float]
-    nautical_dawn: List[float]
-    astro_dawn: List[float]
-    civil_dusk: List[float]
-    nautical_dusk: List[float]
-    astro_dusk: List[float]
+    sunrise: np.ndarray
+    sunset: np.ndarray
+    civil_dawn: np.ndarray
+    nautical_dawn: np.ndarray
+    astro_dawn: np.ndarray
+    civil_dusk: np.ndarray
+    nautical_dusk: np.ndarray
+    astro_dusk: np.ndarray
 
 @dataclass
 class DawnData:
-    sunrise: List[float]
-    civil_dawn: List[float]
-    nautical_dawn: List[float]
-    astro_dawn: List[float]
+    sunrise: np.ndarray
+    civil_dawn: np.ndarray
+    nautical_dawn: np.ndarray
+    astro_dawn: np.ndarray
 
 
 @dataclass
@@ -3,7 +3,9 @@ from components.base_calendar_plotter import BaseCalendarPlotter
 from components.layer import Layer
 import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.collections import PolyCollection
 import math
+from functools import cached_property
 
 class DawnLayer(Layer):
     PHASES = [
@@ -13,32 +15,29 @@ class DawnLayer(Layer):
         ('astro', 'Astronomical Twilight', 'Sun 12° to 18° below horizon'),
         ('night', 'Night', 'Sun > 18° below horizon')
     ]
+    SERIES = ('sunrise', 'civil_dawn', 'nautical_dawn', 'astro_dawn')
 
     def __init__(self, config):
         self.config = config
         self.dawn_data = config.dawn_data
         self.data_handler = DataHandler(self.config)
 
-    @property
+    @cached_property
     def start_time(self):
         """Calculate the earliest astronomical dawn."""
-        return math.floor(min(self.dawn_data.astro_dawn) * 4) / 4
+        return math.floor(self.dawn_data.astro_dawn.min() * 4) / 4
 
-    @property
+    @cached_property
     def end_time(self):
         """Calculate the latest sunrise."""
-        return math.ceil(max(self.dawn_data.sunrise) * 4) / 4 + 0.25
+        return math.ceil(self.dawn_data.sunrise.max() * 4) / 4 + 0.25
 
     def plot(self, ax: plt.Axes, base: BaseCalendarPlotter):
         days, smoothen = self.config.days_in_year, self.config.smoothen
-        smooth = lambda x: self.data_handler.smooth_data(x, days, smoothen) / 24
         
-        data = {
-            k: smooth(getattr(self.dawn_data, k))
-            for k in ['sunrise', 'civil_dawn', 'nautical_dawn', 'astro_dawn']
-        }
+        data = self.data_handler.smooth_fields(self.dawn_data, self.SERIES, days, smoothen)
         
-        x = np.linspace(0, 2*np.pi, days)
+        x = base.theta
         daylight_offset = (self.end_time - self.start_time)/24 * 0.03
         top = (self.end_time/24) - daylight_offset
         
@@ -50,8 +49,21 @@ class DawnLayer(Layer):
             (data['civil_dawn'], data['sunrise'], 'civil', 3)
         ]
         
-        for bottom, top, color, zorder in layers:
-            ax.fill_between(x, bottom, top, color=self.config.colors[color], zorder=zorder)
+        # One PolyCollection per zorder instead of a fill_between call per band
+        for zorder in (2, 3):
+            bands = [(bottom, top, color) for bottom, top, color, z in layers if z == zorder]
+            ax.add_collection(PolyCollection(
+                [self._band(x, bottom, top) for bottom, top, _ in bands],
+                color=[self.config.colors[color] for _, _, color in bands],
+                zorder=zorder), autolim=False)
+
+    @staticmethod
+    def _band(x, bottom, top):
+        """Closed polygon between two curves (or constants) over x."""
+        bottom = np.broadcast_to(bottom, x.shape)
+        top = np.broadcast_to(top, x.shape)
+        return np.concatenate([np.column_stack([x, bottom]),
+                               np.column_stack([x[::-1], top[::-1]])])
 
     def footer(self, fig: plt.Figure, dims, base: BaseCalendarPlotter):
         ax = fig.add_axes([dims['left'], dims['bottom'], dims['width'], 0.1])
@@ -60,11 +72,13 @@ class DawnLayer(Layer):
         ax.set_xlim(0, 1)
         ax.set_ylim(0, 0.2)
         
+        colors = self.config.colors
+        title_color = colors['title_text']
         x_pos = np.linspace(0.1, 0.9, len(self.PHASES))
         for x, (color_key, label, desc) in zip(x_pos, self.PHASES):
-            ax.add_patch(plt.Circle((x, 0.15), 0.015, color=self.config.colors[color_key]))
+            ax.add_patch(plt.Circle((x, 0.15), 0.015, color=colors[color_key]))
             ax.text(x, 0.125, label, ha='center', va='center', 
-                   color=self.config.colors['title_text'], fontsize=8, 
+                   color=title_color, fontsize=8, 
                    alpha=0.7, fontweight='bold')
             ax.text(x, 0.117, desc, ha='center', va='center',
-                   color=self.config.colors['title_text'], fontsize=6, alpha=0.5)
+                   color=title_color, fontsize=6, alpha=0.5)
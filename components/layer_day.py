@@ -13,6 +13,9 @@ class DayLayer(Layer):
         ('night', 'Night', 'Sun > 18° below horizon')
     ]
 
+    SERIES = ('sunrise', 'sunset', 'civil_dawn', 'nautical_dawn',
+              'astro_dawn', 'civil_dusk', 'nautical_dusk', 'astro_dusk')
+
     def __init__(self, config):
         self.config = config
         self.day_data = config.sun_data
@@ -30,15 +33,10 @@ class DayLayer(Layer):
 
     def plot(self, ax: plt.Axes, base: BaseCalendarPlotter):
         days, smoothen = self.config.days_in_year, self.config.smoothen
-        smooth = lambda x: self.data_handler.smooth_data(x, days, smoothen) / 24
         
-        data = {
-            k: smooth(getattr(self.day_data, k)) 
-            for k in ['sunrise', 'sunset', 'civil_dawn', 'nautical_dawn', 
-                     'astro_dawn', 'civil_dusk', 'nautical_dusk', 'astro_dusk']
-        }
+        data = self.data_handler.smooth_fields(self.day_data, self.SERIES, days, smoothen)
         
-        x = np.linspace(0, 2*np.pi, days)
+        x = base.theta
         daylight_offset = (self.end_time - self.start_time)/24 * 0.03
         top = (self.end_time/24) - daylight_offset
         
@@ -64,11 +62,13 @@ class DayLayer(Layer):
         ax.set_xlim(0, 1)
         ax.set_ylim(0, 0.2)
         
+        colors = self.config.colors
+        title_color = colors['title_text']
         x_pos = np.linspace(0.1, 0.9, len(self.PHASES))
         for x, (color_key, label, desc) in zip(x_pos, self.PHASES):
-            ax.add_patch(plt.Circle((x, 0.15), 0.015, color=self.config.colors[color_key]))
+            ax.add_patch(plt.Circle((x, 0.15), 0.015, color=colors[color_key]))
             ax.text(x, 0.125, label, ha='center', va='center', 
-                   color=self.config.colors['title_text'], fontsize=8, 
+                   color=title_color, fontsize=8, 
                    alpha=0.7, fontweight='bold')
             ax.text(x, 0.117, desc, ha='center', va='center',
-                   color=self.config.colors['title_text'], fontsize=6, alpha=0.5)
\ No newline at end of file
+                   color=title_color, fontsize=6, alpha=0.5)
\ No newline at end of file
@@ -1,11 +1,28 @@
-from components.base_calendar_plotter import BaseCalendarPlotter
+from components.base_calendar_plotter import BaseCalendarPlotter, load_font
 from components.layer import Layer
 import numpy as np
 import matplotlib.pyplot as plt
-from datetime import date, datetime, timedelta
+from datetime import date, datetime
 import json
+import math
+import os
+from functools import lru_cache
 from pathlib import Path
-import matplotlib.font_manager as fm  # Add import for font manager
+
+
+@lru_cache(maxsize=1)
+def _parse_holidays(path, mtime):
+    """Parse the holidays file once; mtime is part of the key so edits are picked up."""
+    with open(path, 'r') as f:
+        data = json.load(f)
+    return tuple(
+        {
+            'name': h['name'],
+            'date': datetime.strptime(h['date'], '%Y-%m-%d').date()
+        }
+        for h in data['holidays']
+    )
+
 
 class HolidaysLayer(Layer):
     def __init__(self, config):
@@ -13,20 +30,13 @@ class HolidaysLayer(Layer):
         self.holidays = self._load_holidays()
         self.include_sundays = getattr(config, 'include_sundays', True)  # Add config for including Sundays
         self.font_path = 'fonts/BPmono.ttf'  # Path to the monospaced font
-        self.font_prop = fm.FontProperties(fname=self.font_path)  # Load the font properties
+        self.font_prop = load_font(self.font_path, None)  # Load the font properties once per process
 
     def _load_holidays(self):
         """Load holidays from JSON file."""
+        path = 'data/holidays.json'
         try:
-            with open('data/holidays.json', 'r') as f:
-                data = json.load(f)
-                return [
-                    {
-                        'name': h['name'],
-                        'date': datetime.strptime(h['date'], '%Y-%m-%d').date()
-                    }
-                    for h in data['holidays']
-                ]
+            return _parse_holidays(path, os.path.getmtime(path))
         except FileNotFoundError:
             print("Warning: holidays.json not found")
             return []
@@ -49,81 +59,82 @@ class HolidaysLayer(Layer):
         # Calculate positioning
         relative_offset = (base.end_time - base.start_time)/24 * 0.015
         label_radius = (base.end_time/24) - relative_offset
-        cum_days = np.cumsum(base.days_in_month)
+        cum_days = base.cumulative_days
+        offset_deg = math.degrees(base.theta_offset)
+        days_to_rad = 2 * np.pi / base.num_points
+        label_color = getattr(self.config.colors, 'holiday_label', '#FF0000')
+        name_color = getattr(self.config.colors, 'holiday_name', '#FF0000')
+        marker_color = getattr(self.config.colors, 'holiday_marker', '#FF0000')
+        sunday_color = getattr(self.config.colors, 'sunday_label', 'gray')
         
         # Calculate the maximum length of holiday names for padding
         max_name_length = max(len(holiday['name']) for holiday in self.holidays) if self.holidays else 0
 
+        # Day of year, angle and day of month for all of this year's holidays at once
+        holidays = [holiday for holiday in self.holidays if holiday['date'].year == base.year]
+        new_year = date(base.year, 1, 1)
+        doys = np.fromiter(((holiday['date'] - new_year).days for holiday in holidays),
+                           dtype=np.int32, count=len(holidays))
+        angles = (doys + 0.5) * days_to_rad  # Offset by 0.5 days for 12 PM
+        month_idx = np.searchsorted(cum_days, doys, side='right')
+        month_days = doys - np.where(month_idx > 0, cum_days[month_idx - 1], 0) + 1
+
+        # Rotations for the date markers and the names
+        base_rotations = (-np.degrees(angles) + 180) % 360
+        adjusted_rotations = base_rotations - 180 + offset_deg - 90
+        # Names in the second half of the year are flipped so they read outwards
+        second_half = np.array([holiday['date'].month > 6 for holiday in holidays], dtype=bool)
+        name_rotations = base_rotations - 90 + offset_deg - 90 + np.where(second_half, 180, 0)
+        
+        # Pad names with a monospaced font so they line up: left padding for the
+        # second half of the year, right padding for the first half
+        padded_names = [holiday['name'].ljust(max_name_length) if is_second_half
+                        else holiday['name'].rjust(max_name_length)
+                        for holiday, is_second_half in zip(holidays, second_half.tolist())]
+        
+        name_radius = label_radius - relative_offset * 10.5 # Adjust offset as needed
+        marker_radius = label_radius + relative_offset
+
         # Plot holidays
-        for holiday in self.holidays:
-            if holiday['date'].year != base.year:
-                continue
-                
-            day_of_year = (holiday['date'] - date(base.year, 1, 1)).days
-            angle = (day_of_year + 0.5) / base.config.days_in_year * 2 * np.pi  # Offset by 0.5 days for 12 PM
-            
-            month_idx = next((i for i, total in enumerate(cum_days) if day_of_year < total), 11)
-            month_day = day_of_year - (cum_days[month_idx - 1] if month_idx > 0 else 0) + 1
-            
-            rotation = (-np.degrees(angle) + 180) % 360 - 180
-            adjusted_rotation = rotation + np.degrees(base.theta_offset) - 90
-            
+        for angle, month_day, adjusted_rotation, padded_name, rotation in zip(
+                angles.tolist(), month_days.tolist(), adjusted_rotations.tolist(),
+                padded_names, name_rotations.tolist()):
             # Plot date marker
             ax.text(angle, label_radius, str(month_day),
                 ha='center', va='center', 
                 fontsize=8,
-                color=getattr(self.config.colors, 'holiday_label', '#FF0000'),
+                color=label_color,
                 rotation=adjusted_rotation,
                 zorder=5)
             
-            # Determine if the holiday is in the second half of the year
-            is_second_half = holiday['date'].month > 6
-            
             # Add holiday name with padding and monospaced font
-            if is_second_half:
-                padded_name = holiday['name'].ljust(max_name_length)  # Left padding for second half
-            else:
-                padded_name = holiday['name'].rjust(max_name_length)  # Right padding for first half
-            
-            name_radius = label_radius - relative_offset * 10.5 # Adjust offset as needed
-            rotation = (-np.degrees(angle) + 180) % 360 - 90                
-            rotation = rotation + np.degrees(base.theta_offset) - 90
-
-            if is_second_half:
-                rotation += 180  # Flip the name for the second half of the year
-            
             ax.text(angle, name_radius, padded_name,
                 ha='center', va='center',  # Keep alignment centered
                 fontsize=8,
                 fontproperties=self.font_prop,  # Use loaded monospaced font
-                color=getattr(self.config.colors, 'holiday_name', '#FF0000'),
+                color=name_color,
                 rotation=rotation,
                 zorder=50)
             
             # Add marker dot
-            marker_radius = label_radius + relative_offset
             ax.plot(angle, marker_radius, 'o',
-                color=getattr(self.config.colors, 'holiday_marker', '#FF0000'),
+                color=marker_color,
                 markersize=3,
                 zorder=5)
 
         # Plot Sundays if configured
         if self.include_sundays:
-            first = date(base.year, 1, 1)
-            first_sunday = ((first + timedelta(days=(6 - first.weekday()) % 7)) - first).days
-            sundays = range(first_sunday, base.config.days_in_year, 7)
+            sundays = np.arange(base.first_sunday, base.config.days_in_year, 7)
+            month_idx = np.searchsorted(cum_days, sundays, side='right')
+            month_days = sundays - np.where(month_idx > 0, cum_days[month_idx - 1], 0) + 1
+            angles = (sundays + 0.5) * days_to_rad
+            rotations = (-np.degrees(angles) + 180) % 360 - 180 + offset_deg - 90
             
-            for day_idx in sundays:
-                angle = (day_idx + 0.5) / base.config.days_in_year * 2 * np.pi
-                month_idx = next((i for i, total in enumerate(cum_days) if day_idx < total), 11)
-                month_day = day_idx - (cum_days[month_idx - 1] if month_idx > 0 else 0) + 1
-                rotation = (-np.degrees(angle) + 180) % 360 - 180
-                adjusted_rotation = rotation + np.degrees(base.theta_offset) - 90
-                
+            for angle, month_day, rotation in zip(angles.tolist(), month_days.tolist(), rotations.tolist()):
                 ax.text(angle, label_radius, str(month_day),
                     ha='center', va='center', fontsize=8, 
-                    color=getattr(self.config.colors, 'sunday_label', 'gray'),
-                    rotation=adjusted_rotation, 
+                    color=sunday_color,
+                    rotation=rotation, 
                     zorder=5, fontweight='normal')
 
     def footer(self, fig: plt.Figure, dims, base: BaseCalendarPlotter):
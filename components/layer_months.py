@@ -20,37 +20,31 @@ class MonthsLayer(Layer):
 
     def plot(self, ax: plt.Axes, base):
         """Add month labels and dividing lines."""
-        days_in_month = base.days_in_month
-        cumulative_days = np.cumsum(days_in_month)
-        month_ticks = [(cumulative_days[i - 1] if i > 0 else 0) + days_in_month[i] / 2
-                      for i in range(12)]
-        month_ticks_rad = [tick / base.num_points * 2 * np.pi for tick in month_ticks]
+        cumulative_days = base.cumulative_days
+        days_to_rad = 2 * np.pi / base.num_points
+        # Month midpoints: days before the month plus half its length
+        month_starts = np.concatenate(([0], cumulative_days[:-1]))
+        month_ticks_rad = (month_starts + np.asarray(base.days_in_month) / 2) * days_to_rad
 
         # Add labels and lines
         time_range = base.end_time - base.start_time
         label_height = (base.end_time/24) + (time_range / 24 * self.config.months_offset)  # percentage of the time range
         
-        for i, (angle, label) in enumerate(zip(month_ticks_rad, self.month_labels)):
-            rotation = (-np.degrees(angle) + 180) % 360 + 90
-            adjusted_rotation = rotation + np.degrees(base.theta_offset)
+        rotations = (-np.degrees(month_ticks_rad) + 180) % 360 + 90 + np.degrees(base.theta_offset)
+        color = self.config.colors['month_label']
+        for angle, label, rotation in zip(month_ticks_rad.tolist(), self.month_labels, rotations.tolist()):
             ax.text(angle, label_height, label, 
                    ha='center', va='center', 
-                   rotation=adjusted_rotation,
+                   rotation=rotation,
                    fontsize=22, 
-                   color=self.config.colors['month_label'], 
+                   color=color, 
                    fontweight='bold')
 
-            # Add dividing line
-            if i < 11:
-                line_angle = cumulative_days[i] / base.num_points * 2 * np.pi
-            else:
-                line_angle = 2 * np.pi
-                
-            ax.plot([line_angle, line_angle], 
-                    [base.start_time/24, base.end_time/24],
-                    color=self.config.colors['divider'], 
-                    linewidth=0.5, 
-                    zorder=10)
+        # Add dividing lines, all 12 in a single vlines collection
+        ax.vlines(base.month_boundaries_rad, base.start_time/24, base.end_time/24,
+                  colors=self.config.colors['divider'],
+                  linewidth=0.5,
+                  zorder=10)
 
     def footer(self, fig: plt.Figure, dims, base):
         pass 
\ No newline at end of file
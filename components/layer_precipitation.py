@@ -14,7 +14,8 @@ class PrecipitationLayer(Layer):
         self.config.precip_footer_offset = getattr(self.config, 'precip_footer_offset', 0.04)
         
         # Add precipitation plotting parameters
-        self.n_r = 20  # Number of radial points for smoothness
+        # Every ring carries the same colours, so the inner and outer edge are enough
+        self.n_r = 2  # Number of radial points
 
     @property
     def start_time(self):
@@ -33,7 +34,7 @@ class PrecipitationLayer(Layer):
             return  # Skip if no precipitation data available
 
         # Create coordinate system for precipitation band
-        theta = np.linspace(0, 2*np.pi, base.num_points)
+        theta = base.theta
 
         # Scale the precipitation band to fit within the plot's y-limits
         r_min = base.start_time/24
@@ -61,15 +62,17 @@ class PrecipitationLayer(Layer):
                 precip_data = precip_data[:base.num_points]
             else:
                 # Pad with nearest neighbor
-                padding = base.num_points - len(precip_data)
-                precip_data = np.pad(precip_data, (0, padding), mode='edge')
+                padded = np.empty(base.num_points, dtype=precip_data.dtype)
+                padded[:len(precip_data)] = precip_data
+                padded[len(precip_data):] = precip_data[-1]
+                precip_data = padded
 
         # Store original precipitation data for colorbar
         base.precip_min = np.min(precip_data)
         base.precip_max = np.max(precip_data)
 
-        # Create 2D arrays for coloring
-        precip_colors = np.tile(precip_data, (self.n_r, 1))
+        # Create 2D arrays for coloring, a read-only view repeating the same row
+        precip_colors = np.broadcast_to(precip_data, (self.n_r, base.num_points))
 
         # Create meshgrid for plotting
         THETA, R_TEMP = np.meshgrid(theta, r_precip_grid)
@@ -114,7 +117,8 @@ class PrecipitationLayer(Layer):
         colorbar.set_ticklabels([f'{t:.1f}mm' for t in ticks])
 
         colorbar.ax.tick_params(labelsize=6)  # Adjust tick label size
+        title_color = self.config.colors['title_text']
         for label in colorbar.ax.get_xticklabels():
             label.set_alpha(0.5)  # Add transparency
             # Match color with other text
-            label.set_color(self.config.colors['title_text'])
+            label.set_color(title_color)
@@ -1,12 +1,65 @@
-import json
+import os
+import tempfile
+import zipfile
 import numpy as np
-from datetime import datetime, date
+from functools import lru_cache
+from matplotlib.collections import LineCollection
+from matplotlib.colors import to_rgba_array
+from components.data_handler import load_json
 from components.layer import Layer
 
+ACTIVITIES_FILE = "data/strava_activities.json"
+# Bump whenever the cached columns change so older .npz caches are rebuilt
+CACHE_VERSION = 1
+CACHE_COLUMNS = ("count", "start", "distance", "type_code")
+
+
+@lru_cache(maxsize=1)
+def _read_activities(path, mtime):
+    """
+    Runs and walks from the Strava export as columns, parsed once per file version.
+    The columns are also saved next to the export as an .npz file so later runs skip
+    the JSON altogether; mtime is part of both cache keys so a fresh export is picked up.
+    """
+    cache_path = os.path.splitext(path)[0] + ".cache.npz"
+    try:
+        with np.load(cache_path) as cached:
+            if cached["version"] == CACHE_VERSION and cached["mtime"] == mtime:
+                return {k: cached[k] for k in CACHE_COLUMNS}
+    except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+        pass  # Missing, older layout or unreadable cache, rebuild it below
+
+    with open(path, "rb") as f:
+        activities = load_json(f.read())
+    runs = [a for a in activities if a["type"] in {"Run", "Walk"}]
+
+    columns = {
+        "count": np.array(len(activities)),
+        # Strava's start_date is UTC with a trailing Z, which datetime64 would warn about
+        "start": np.array([a["start_date"].rstrip("Z") for a in runs], dtype="datetime64[m]"),
+        "distance": np.array([a["distance"] for a in runs], dtype=np.float32) / 1000,  # Convert to km
+        "type_code": np.array([a["type"] == "Walk" for a in runs], dtype=np.uint8),  # 0=Run, 1=Walk
+    }
+    # Written to a temporary file and renamed into place, so a worker process
+    # reading the cache never sees another worker's half-written file
+    tmp_path = None
+    try:
+        with tempfile.NamedTemporaryFile(dir=os.path.dirname(cache_path) or ".",
+                                         suffix=".npz", delete=False) as tmp:
+            tmp_path = tmp.name
+            np.savez(tmp, version=CACHE_VERSION, mtime=mtime, **columns)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # Not being able to write the cache only costs the next run a parse
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return columns
+
+
 class StravaLayer(Layer):
     def __init__(self, config):
         self.config = config
-        self.run_data = []
+        self.run_data = {}
     
     @property
     def start_time(self): return None
@@ -16,41 +69,43 @@ class StravaLayer(Layer):
     
     def load_data(self):
         """Load and process run/walk activities from Strava data file"""
-        with open("data/strava_activities.json", "r") as f:
-            activities = json.load(f)
+        activities = _read_activities(ACTIVITIES_FILE, os.path.getmtime(ACTIVITIES_FILE))
 
-        print(f"Loaded {len(activities)} activities from Strava.")
+        print(f"Loaded {int(activities['count'])} activities from Strava.")
         
-        for activity in activities:
-            if activity["type"] not in {"Run", "Walk"}:
-                continue
-                
-            activity_date = datetime.fromisoformat(activity["start_date"]).date()
-            
-            try:
-                projected_date = activity_date.replace(year=self.config.year)
-            except ValueError:
-                print(f"Skipping invalid date in Strava data: {activity_date}")
-                continue
-                
-            day_of_year = (projected_date - date(self.config.year, 1, 1)).days + 1
-            start_datetime = datetime.fromisoformat(activity["start_date"])
-            
-            self.run_data.append({
-                "date": activity_date.isoformat(),
-                "day_of_year": day_of_year,
-                "start_time": start_datetime.hour + start_datetime.minute / 60,
-                "distance": activity["distance"] / 1000,  # Convert to km
-                "type": activity["type"],
-                "elapsed_time": activity["elapsed_time"],
-                "year": activity_date.year,
-                "alpha": 0.25 if activity_date.year < self.config.year else 1.0
-            })
+        start = activities["start"]
+        start_day = start.astype("datetime64[D]")
+        start_month = start.astype("datetime64[M]")
+
+        # Move every activity to the same month and day of the configured year
+        month = np.datetime64(f"{self.config.year}-01", "M") + start_month.astype(int) % 12
+        projected = month.astype("datetime64[D]") + (start_day - start_month.astype("datetime64[D]"))
+        # 29 February has no counterpart in a common year and would spill into March
+        valid = projected.astype("datetime64[M]") == month
+        for skipped in start_day[~valid]:
+            print(f"Skipping invalid date in Strava data: {skipped}")
+
+        days = (projected - np.datetime64(f"{self.config.year}-01-01")).astype(int) + 1
+        years = start.astype("datetime64[Y]").astype(int) + 1970
+
+        # One compact array per field, sorted by day of year
+        order = np.flatnonzero(valid)
+        order = order[np.argsort(days[order], kind="stable")]
+        years = years[order].astype(np.int32)
+        self.run_data = {
+            "day_of_year": days[order].astype(np.int32),
+            "start_time": ((start - start_day)[order].astype(int) / 60).astype(np.float32),
+            "distance": activities["distance"][order],
+            "type_code": activities["type_code"][order],
+            "year": years,
+            "alpha": np.where(years < self.config.year, 0.25, 1.0).astype(np.float32)
+        }
 
     def plot(self, ax, base):
         """Plot activities and progress visualization"""
         self.load_data()
-        if not self.run_data:
+        run_data = self.run_data
+        if not len(run_data["day_of_year"]):
             print("No data to plot in StravaLayer.")
             return
 
@@ -59,38 +114,36 @@ class StravaLayer(Layer):
         activity_scale = (time_range / 100) / 24  # 1km = 1% of time range
         radial_range = (base.end_time - base.start_time) / 24
         km_to_radial = (radial_range * 0.9) / 1000 # Cover 90% of radial range
+        days_to_rad = 2 * np.pi / base.num_points
 
-        # Plot individual activities
-        self.run_data.sort(key=lambda x: x["day_of_year"])
-        for activity in self.run_data:
-            theta = activity["day_of_year"] / base.num_points * 2 * np.pi
-            r_start = activity["start_time"] / 24
-            r_end = r_start + activity["distance"] * activity_scale
-            
-            ax.plot([theta, theta], [r_start, r_end],
-                   color="red" if activity["type"] == "Run" else "blue",
-                   alpha=activity["alpha"], zorder=20)
+        # Plot individual activities, one radial segment each, as a single LineCollection
+        theta = run_data["day_of_year"] * days_to_rad
+        r_start = run_data["start_time"] / 24
+        r_end = r_start + run_data["distance"] * activity_scale
+        segments = np.stack([np.column_stack([theta, r_start]),
+                             np.column_stack([theta, r_end])], axis=1)
+        colors = to_rgba_array(["red", "blue"])[run_data["type_code"]]
+        colors[:, 3] = run_data["alpha"]
+        ax.add_collection(LineCollection(segments, colors=colors, capstyle="projecting",
+                                         zorder=20), autolim=False)
 
         # Plot yearly cumulative distances
-        for year in sorted(set(a["year"] for a in self.run_data)):
-            cumulative = 0
-            theta_points, r_points = [], []
-            
-            for activity in filter(lambda x: x["year"] == year, self.run_data):
-                cumulative += activity["distance"]
-                theta_points.append(activity["day_of_year"] / base.num_points * 2 * np.pi)
-                r_points.append(base.start_time / 24 + cumulative * km_to_radial)
+        for year in np.unique(run_data["year"]).tolist():
+            in_year = run_data["year"] == year
+            cumulative = np.cumsum(run_data["distance"][in_year])
             
-            ax.plot(theta_points, r_points, color="green", lw=.5,
+            ax.plot(theta[in_year],
+                   base.start_time / 24 + cumulative * km_to_radial,
+                   color="green", lw=.5,
                    alpha=0.25 if year < self.config.year else 1.0, zorder=15)
 
         # Plot target line for 1000km goal
         daily_target = self.config.running_target / base.num_points
-        target_points = [(day / base.num_points * 2 * np.pi,
-                         base.start_time / 24 + (day * daily_target) * km_to_radial)
-                        for day in range(1, base.num_points + 1)]
+        days = np.arange(1, base.num_points + 1)
         
-        ax.plot(*zip(*target_points), color="gray", lw=1,
+        ax.plot(days * days_to_rad,
+               base.start_time / 24 + (days * daily_target) * km_to_radial,
+               color="gray", lw=1,
                linestyle="--", alpha=0.25, zorder=10)
 
     def footer(self, fig, dims, base):
@@ -114,6 +167,7 @@ class StravaLayer(Layer):
             ('Target', 'gray', f'{self.config.running_target}km yearly goal')
         ]
 
+        title_color = self.config.colors['title_text']
         for x, (label, color, desc) in zip(np.linspace(0.1, 0.9, len(legend_items)), legend_items):
             ax.plot([x - 0.02, x + 0.02], [0.15, 0.15], 
                     color=color, 
@@ -122,9 +176,9 @@ class StravaLayer(Layer):
                     linewidth=1)
             
             ax.text(x, 0.125, label, ha='center', va='center',
-                color=self.config.colors['title_text'],
+                color=title_color,
                 fontsize=8, alpha=0.7, fontweight='normal')
             
             ax.text(x, 0.1, desc, ha='center', va='center',
-                color=self.config.colors['title_text'],
+                color=title_color,
                 fontsize=6, alpha=0.5)
\ No newline at end of file
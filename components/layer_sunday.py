@@ -2,7 +2,6 @@ from components.base_calendar_plotter import BaseCalendarPlotter
 from components.layer import Layer
 import numpy as np
 import matplotlib.pyplot as plt
-from datetime import date, timedelta
 
 class SundayLayer(Layer):
     def __init__(self, config):
@@ -18,23 +17,24 @@ class SundayLayer(Layer):
 
     def plot(self, ax: plt.Axes, base: BaseCalendarPlotter):
         # Get first Sunday and calculate positions
-        first = date(base.year, 1, 1)
-        first_sunday = ((first + timedelta(days=(6 - first.weekday()) % 7)) - first).days
-        sundays = range(first_sunday, base.config.days_in_year, 7)
+        sundays = np.arange(base.first_sunday, base.config.days_in_year, 7)
         relative_offset = (base.end_time - base.start_time)/24 * 0.018
         label_radius = (base.end_time/24) - relative_offset
-        cum_days = np.cumsum(base.days_in_month)
-        
-        for day_idx in sundays:
-            angle = (day_idx + 0.5) / base.config.days_in_year * 2 * np.pi
-            month_idx = next((i for i, total in enumerate(cum_days) if day_idx < total), 11)
-            month_day = day_idx - (cum_days[month_idx - 1] if month_idx > 0 else 0) + 1
-            
-            ax.text(angle, label_radius, str(month_day),
-                   ha='center', va='center', fontsize=14, 
-                   color=self.config.colors['sunday_label'],
-                   rotation=(-np.degrees(angle) + 180) % 360 - 180, 
-                   zorder=5, fontweight='normal')
+        cum_days = base.cumulative_days
+
+        # Day of month, angle and rotation for every Sunday in one vectorized pass
+        month_idx = np.searchsorted(cum_days, sundays, side='right')
+        month_days = sundays - np.where(month_idx > 0, cum_days[month_idx - 1], 0) + 1
+        angles = (sundays + 0.5) / base.config.days_in_year * 2 * np.pi
+        rotations = (-np.degrees(angles) + 180) % 360 - 180
+
+        text = ax.text
+        color = self.config.colors['sunday_label']
+        for angle, month_day, rotation in zip(angles.tolist(), month_days.tolist(), rotations.tolist()):
+            text(angle, label_radius, str(month_day),
+                 ha='center', va='center', fontsize=14,
+                 color=color, rotation=rotation,
+                 zorder=5, fontweight='normal')
 
     def footer(self, fig: plt.Figure, dims, base: BaseCalendarPlotter):
         pass
\ No newline at end of file
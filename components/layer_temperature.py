@@ -16,7 +16,7 @@ class TemperatureLayer(Layer):
         # Default offsets if not in config
         self.config.temp_offset = getattr(self.config, 'temp_offset', 0.042)
         self.config.temp_footer_offset = getattr(self.config, 'temp_footer_offset', 0.04)
-        self.n_r = 20  # Radial points for interpolation
+        self.n_r = 2  # Radial points, inner and outer edge: every ring has the same colours
 
     @property
     def start_time(self): return None
@@ -31,7 +31,7 @@ class TemperatureLayer(Layer):
             return
 
         # Set up coordinates
-        theta = np.linspace(0, 2*np.pi, base.num_points)
+        theta = base.theta
         time_range = base.end_time - base.start_time
         
         # Calculate band position
@@ -41,7 +41,7 @@ class TemperatureLayer(Layer):
         r_temp_grid = np.linspace(r_mid - band_width/2, r_mid + band_width/2, self.n_r)
 
         # Prepare temperature data
-        temp_data = np.array(self.weather_data.temperature)
+        temp_data = np.asarray(self.weather_data.temperature, dtype=np.float32)
         if len(temp_data) != base.num_points:
             temp_data = self._adjust_data_length(temp_data, base.num_points)
 
@@ -50,7 +50,7 @@ class TemperatureLayer(Layer):
         
         # Create and plot temperature band
         THETA, R_TEMP = np.meshgrid(theta, r_temp_grid)
-        temp_colors = np.tile(temp_data, (self.n_r, 1))
+        temp_colors = np.broadcast_to(temp_data, (self.n_r, temp_data.size))  # Read-only view, no copy
         
         self.temp_plot = ax.pcolormesh(
             THETA, R_TEMP, temp_colors,
@@ -64,7 +64,11 @@ class TemperatureLayer(Layer):
         """Adjust data length to match target length."""
         if len(data) > target_length:
             return data[:target_length]
-        return np.pad(data, (0, target_length - len(data)), mode='edge')
+        # Pad with the last value
+        padded = np.empty(target_length, dtype=data.dtype)
+        padded[:len(data)] = data
+        padded[len(data):] = data[-1]
+        return padded
 
     def footer(self, fig, dims, base: BaseCalendarPlotter):
         """Add temperature scale colorbar to footer."""
@@ -95,6 +99,7 @@ class TemperatureLayer(Layer):
         
         # Style tick labels
         colorbar.ax.tick_params(labelsize=6)
+        title_color = base.colors['title_text']
         for label in colorbar.ax.get_xticklabels():
             label.set_alpha(0.5)
-            label.set_color(base.colors['title_text'])
\ No newline at end of file
+            label.set_color(title_color)
\ No newline at end of file
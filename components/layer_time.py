@@ -1,6 +1,9 @@
 from components.layer import Layer
+import math
 import numpy as np
+from functools import lru_cache
 import matplotlib.pyplot as plt
+from matplotlib.collections import PolyCollection
 
 class TimeLayer(Layer):
     def __init__(self, config):
@@ -21,80 +24,79 @@ class TimeLayer(Layer):
         return None
 
     @staticmethod
+    def _count_steps(start, end, interval):
+        """Number of whole intervals from start that fall before end."""
+        # Rounded so float error in the ratio can't add or drop a step
+        return int(np.ceil(round((end - start) / interval, 10)))
+
+    @staticmethod
+    @lru_cache(maxsize=64)
     def generate_hour_ticks(start, end, interval=0.25):
-        """Generate tick positions for hour markers."""
-        def frange(start, stop, step):
-            """Generate a range of floating-point numbers."""
-            while start < stop:
-                yield round(start, 10)  # Avoid floating-point imprecision
-                start += step
-                
-        return [h / 24 for h in frange(start, end, interval)]
+        """Generate tick positions for hour markers, cached per time range."""
+        n = TimeLayer._count_steps(start, end, interval)
+        ticks = np.round(start + interval * np.arange(n), 10) / 24
+        ticks.flags.writeable = False  # Shared between callers
+        return ticks
 
     @staticmethod
+    @lru_cache(maxsize=64)
     def generate_hour_labels(start, end, interval=0.25):
-        """Generate labels for hour markers."""
-        labels = [' ']  # Start with a blank space
-        time = start + interval  # Start from the first quarter past the start time
-        while time < end - interval:  # Stop before the end time
-            hours = int(time)
-            minutes = int((time % 1) * 60)
-            am_pm = "AM" if hours < 12 else "PM"
-            labels.append(f"{(hours - 1) % 12 + 1}:{minutes:02}{am_pm}")
-            time += interval  # Increment by the specified interval in minutes
-        return labels
+        """Generate labels for hour markers, cached per time range."""
+        # Start with a blank space, then every interval from the first quarter
+        # past the start time, stopping before the end time
+        n = TimeLayer._count_steps(start, end, interval)
+        total_minutes = np.round((start + interval * np.arange(1, n - 1)) * 60, 6)
+        hours = (total_minutes // 60).astype(int)
+        minutes = (total_minutes % 60).astype(int)
+        return (' ',) + tuple(f"{(h - 1) % 12 + 1}:{m:02}{'AM' if h < 12 else 'PM'}"
+                              for h, m in zip(hours.tolist(), minutes.tolist()))
 
     def plot(self, ax: plt.Axes, base):
         """Add hour labels and tick marks."""
-        # Generate labels and ticks if not already generated
-        if self.hour_labels is None:
-            self.hour_labels = self.generate_hour_labels(
-                base.start_time, base.end_time, self.config.interval)
-            self.hour_ticks = self.generate_hour_ticks(
-                base.start_time, base.end_time, self.config.interval)
+        # Cheap after the first plot with the same time range
+        self.hour_labels = self.generate_hour_labels(
+            base.start_time, base.end_time, self.config.interval)
+        self.hour_ticks = self.generate_hour_ticks(
+            base.start_time, base.end_time, self.config.interval)
 
-        theta = np.linspace(
-            0, 2 * np.pi, base.num_points)  # Circular positions
+        theta = base.theta
 
-        # Add tick marks around the circle (only once)
-        for radius in self.hour_ticks:
-            ax.fill_between(theta, radius - 0.0001, radius + 0.0001,
-                          color='gray', alpha=0.4, zorder=3, linewidth=0)
+        # Add tick marks around the circle as thin rings in a single collection
+        rings = [np.concatenate([np.column_stack([theta, np.full_like(theta, radius - 0.0001)]),
+                                 np.column_stack([theta[::-1], np.full_like(theta, radius + 0.0001)])])
+                 for radius in self.hour_ticks]
+        ax.add_collection(PolyCollection(rings, color='gray', alpha=0.4,
+                                         zorder=3, linewidths=0),
+                          autolim=False)
 
         # Add labels at each specified angle
+        color = self.config.colors['time_label']
+        rotation_radians = base.theta_offset - np.pi/2
         for angle_rad in self.label_angles_rad:
-            for i, label in enumerate(self.hour_labels):
-                label = " "+label  # Dirty hack to add some space between axes and labels
-                radius = self.hour_ticks[i]  # Distance from the center
-
-                # Convert radians to degrees for label rotation
-                angle_deg = np.degrees(angle_rad)
-
-                # Calculate text rotation based on angle position
-                # This ensures text is always readable from the outside
-                if angle_deg == 90:
-                    text_angle = 0  # No rotation
-                    ha = 'left'
-                    label = " " + label.strip()
-                elif angle_deg == 270:
-                    text_angle = 0  # No rotation
-                    ha = 'right'
-                    label = label.strip() + " "
-                elif 90 < angle_deg < 270:
-                    text_angle = angle_deg + 180
-                    ha = 'right'
-                    label = label.strip() + " "  # Move spacing to right side
-                else:
-                    text_angle = angle_deg
-                    ha = 'left'
-                    label = " " + label.strip()  # Move spacing to left side
+            text_angle, ha = self._resolve_angle(math.degrees(angle_rad))
+            # Spacing between the axis and the label goes on the side facing the axis
+            if ha == 'left':
+                labels = [" " + label.strip() for label in self.hour_labels]
+            else:
+                labels = [label.strip() + " " for label in self.hour_labels]
 
+            for label, radius in zip(labels, self.hour_ticks.tolist()):
                 # Add hour label with rotation to align along the radial direction
-                rotation_radians = base.theta_offset - np.pi/2
                 ax.text(angle_rad + rotation_radians, radius, label,
                        ha=ha, va='center', fontsize=9,
-                       color=self.config.colors['time_label'], zorder=10,
+                       color=color, zorder=10,
                        rotation=text_angle)
 
+    @staticmethod
+    def _resolve_angle(angle_deg):
+        """Text rotation and alignment for labels at angle_deg, readable from the outside."""
+        if angle_deg == 90:
+            return 0, 'left'  # No rotation
+        if angle_deg == 270:
+            return 0, 'right'  # No rotation
+        if 90 < angle_deg < 270:
+            return angle_deg + 180, 'right'
+        return angle_deg, 'left'
+
     def footer(self, fig: plt.Figure, dims, base):
         pass 
\ No newline at end of file
@@ -1,11 +1,12 @@
 import matplotlib.pyplot as plt
-from matplotlib.font_manager import FontProperties
 import numpy as np
 from datetime import datetime
 from components.base_calendar_plotter import BaseCalendarPlotter
 
 
 class WallpaperCalendarPlotter(BaseCalendarPlotter):
+    title_font_sizes = {'bold': 48, 'regular': 16, 'year': 36}
+
     def setup_plot(self):
         """Initialize and configure the plot for wallpaper format."""
         # Get dimensions from wallpaper config
@@ -49,22 +50,13 @@ class WallpaperCalendarPlotter(BaseCalendarPlotter):
     def calculate_rotation_for_current_month(self):
         """Calculate rotation needed to put current month at top."""
         current_month = 1 #datetime.now().month
-        days_before_month = sum(self.days_in_month[:current_month-1])
+        days_before_month = int(self.cumulative_days[current_month-2]) if current_month > 1 else 0
         angle = (days_before_month / self.config.days_in_year) * 360
         return angle
 
     def add_title(self, ax: plt.Axes) -> None:
         """Add title to the wallpaper plot."""
-        try:
-            font_props = {k: FontProperties(fname=f'./fonts/Arvo-{v}.ttf', size=s)
-                          for k, v, s in [('bold', 'Bold', 48),
-                                        ('regular', 'Regular', 16),
-                                        ('year', 'Regular', 36)]}
-        except:
-            font_props = {k: FontProperties(weight=w, size=s)
-                          for k, (w, s) in {'bold': ('bold', 48),
-                                          'regular': (None, 16),
-                                          'year': (None, 36)}.items()}
+        font_props = self.title_fonts
 
         common_props = {
             'ha': 'right',
@@ -99,6 +91,7 @@ class WallpaperCalendarPlotter(BaseCalendarPlotter):
             from components.layer_time import TimeLayer
             self.layers.append(TimeLayer(self.config))
 
+        self.reset_time_range()
         fig, ax = self.setup_plot()
 
         for layer in self.layers: